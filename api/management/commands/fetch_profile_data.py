@@ -28,6 +28,8 @@ class Command(BaseCommand):
 
     help = "Fetches local investments and updates their option expiration dates."
 
+    _session: requests.Session | None = None
+
     def add_arguments(self, parser) -> None:  # pragma: no cover
         parser.add_argument(
             "--screener_name",
@@ -40,11 +42,20 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args: Any, **options: Any) -> str:
+        try:
+            return self._update_investments(options)
+        finally:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _update_investments(self, options: dict[str, Any]) -> str:
         screener_name: str = options["screener_name"]
-        investments_payload = self._fetch_json(
-            INVESTMENTS_ENDPOINT, params={"screener_type": screener_name}
+        # Only ticker/weekly_options are kept; not binding the full decoded payload lets
+        # it be freed before the per-ticker option lookups below run.
+        investments = self._extract_investments(
+            self._fetch_json(INVESTMENTS_ENDPOINT, params={"screener_type": screener_name})
         )
-        investments = self._extract_investments(investments_payload)
         if not investments:
             raise CommandError(
                 "Investments endpoint did not return any entries with ticker information."
@@ -160,6 +171,13 @@ class Command(BaseCommand):
     # Networking + extraction
     # -------------------------
 
+    def _get_session(self) -> requests.Session:
+        # The option-expirations endpoint takes one symbol per call, so reuse a single
+        # keep-alive connection for every ticker instead of reconnecting each time.
+        if self._session is None:
+            self._session = requests.Session()
+        return self._session
+
     def _fetch_json(
         self,
         url: str,
@@ -167,7 +185,9 @@ class Command(BaseCommand):
         headers: dict[str, str] | None = None,
     ) -> Any:
         try:
-            response = requests.get(url, params=params, headers=headers, timeout=30)
+            response = self._get_session().get(
+                url, params=params, headers=headers, timeout=30
+            )
         except requests.RequestException as exc:  # pragma: no cover
             raise CommandError(f"Failed to call '{url}': {exc}") from exc
         if headers and "x-rapidapi-key" in headers:
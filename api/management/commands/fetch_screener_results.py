@@ -7,6 +7,7 @@ import json
 from pathlib import Path
 from decimal import Decimal, InvalidOperation
 from typing import Any, Iterable, List, Optional
+from urllib.parse import urlencode
 
 import pandas as pd
 import requests
@@ -292,8 +293,9 @@ class Command(BaseCommand):
 
     def _fetch_profile_payload(self, ticker: str) -> Any:
         params = {"symbols": ticker}
-        prepared = requests.Request("GET", PROFILE_ENDPOINT, params=params).prepare()
-        self.stdout.write(f"Fetching profile data from {prepared.url}")
+        # Format the logged URL directly instead of preparing a throwaway
+        # requests.Request per ticker; requests encodes the query the same way.
+        self.stdout.write(f"Fetching profile data from {PROFILE_ENDPOINT}?{urlencode(params)}")
 
         return self._fetch_json(PROFILE_ENDPOINT, params=params, headers=API_HEADERS)
 
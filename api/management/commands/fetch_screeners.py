@@ -11,7 +11,6 @@ from django.db import transaction
 
 from api.custom_filters import (
     CUSTOM_FILTER_PAYLOAD,
-    CUSTOM_FILTER_PAYLOAD_V2,
     EXCHANGE_FILTER_PAYLOAD,
 )
 from api.management.commands.rapidapi_counter import log_rapidapi_fetch
@@ -96,7 +95,6 @@ def _ensure_custom_filters() -> list[str]:
     entries = []
     for name, payload in (
         ("Custom screener filter", CUSTOM_FILTER_PAYLOAD),
-        ("Custom screener filterV2", CUSTOM_FILTER_PAYLOAD_V2),
     ):
         screener_type, _ = ScreenerType.objects.update_or_create(
             name=name,
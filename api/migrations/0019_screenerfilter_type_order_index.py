@@ -0,0 +1,29 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0018_alter_screenerfilter_label"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="screenerfilter",
+            index=models.Index(
+                fields=["screener_type", "display_order", "id"],
+                name="api_scrfilter_type_order_idx",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="screenerfilter",
+            name="screener_type",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="filters",
+                to="api.screenertype",
+            ),
+        ),
+    ]
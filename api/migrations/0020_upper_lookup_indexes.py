@@ -0,0 +1,47 @@
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0019_screenerfilter_type_order_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="duediligencereport",
+            index=models.Index(
+                django.db.models.functions.text.Upper("symbol"),
+                django.db.models.functions.text.Upper("rating"),
+                name="api_ddreport_sym_rating_up_idx",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="duediligencereport",
+            name="symbol",
+            field=models.CharField(max_length=16),
+        ),
+        migrations.AlterField(
+            model_name="duediligencereport",
+            name="rating",
+            field=models.CharField(max_length=16),
+        ),
+        migrations.AddIndex(
+            model_name="financialstatement",
+            index=models.Index(
+                django.db.models.functions.text.Upper("symbol"),
+                django.db.models.functions.text.Upper("period_type"),
+                django.db.models.functions.text.Upper("statement_type"),
+                name="api_finstmt_lookup_upper_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="investment",
+            index=models.Index(
+                django.db.models.functions.text.Upper("category"),
+                models.F("price"),
+                name="api_inv_category_price_idx",
+            ),
+        ),
+    ]
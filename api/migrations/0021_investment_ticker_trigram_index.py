@@ -0,0 +1,31 @@
+from django.db import migrations
+
+
+def create_ticker_trigram_index(apps, schema_editor):
+    # pg_trgm is PostgreSQL-only; the SQLite development database keeps scanning.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # ticker__icontains compiles to UPPER("ticker"::text) LIKE UPPER(%s), so the
+    # index is built on the same expression for the planner to match it.
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS "api_inv_ticker_trgm_idx" '
+        'ON "api_investment" USING gin (UPPER("ticker"::text) gin_trgm_ops)'
+    )
+
+
+def drop_ticker_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS "api_inv_ticker_trgm_idx"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0020_upper_lookup_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_ticker_trigram_index, drop_ticker_trigram_index),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-16 07:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0021_investment_ticker_trigram_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="investment",
+            index=models.Index(fields=["price"], name="api_inv_price_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="investment",
+            index=models.Index(fields=["market_cap"], name="api_inv_market_cap_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="investment",
+            index=models.Index(fields=["volume"], name="api_inv_volume_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="investment",
+            index=models.Index(fields=["rsi"], name="api_inv_rsi_idx"),
+        ),
+    ]
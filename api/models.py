@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Upper
 
 
 class ScreenerType(models.Model):
@@ -19,8 +20,9 @@ class ScreenerType(models.Model):
 class ScreenerFilter(models.Model):
     """Filter associated with a screener type."""
 
+    # The (screener_type, display_order, id) index below already covers FK lookups.
     screener_type = models.ForeignKey(
-        ScreenerType, related_name="filters", on_delete=models.CASCADE
+        ScreenerType, related_name="filters", on_delete=models.CASCADE, db_index=False
     )
     label = models.TextField()
     payload = models.JSONField(blank=True, null=True)
@@ -30,6 +32,14 @@ class ScreenerFilter(models.Model):
 
     class Meta:
         ordering = ["display_order", "id"]
+        indexes = [
+            # Serves the per-screener filters prefetch already sorted, so the
+            # database does not need a separate sort step for each request.
+            models.Index(
+                fields=["screener_type", "display_order", "id"],
+                name="api_scrfilter_type_order_idx",
+            ),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - simple data representation
         return f"{self.screener_type.name}: {self.label}"
@@ -56,6 +66,17 @@ class Investment(models.Model):
 
     class Meta:
         ordering = ["ticker"]
+        indexes = [
+            # Back InvestmentViewSet's filters; keep them in sync with the view.
+            # category__iexact compares UPPER(category); price trails it for the
+            # common category + price range query.
+            models.Index(Upper("category"), "price", name="api_inv_category_price_idx"),
+            # B-tree indexes for the min_/max_ range filters.
+            models.Index(fields=["price"], name="api_inv_price_idx"),
+            models.Index(fields=["market_cap"], name="api_inv_market_cap_idx"),
+            models.Index(fields=["volume"], name="api_inv_volume_idx"),
+            models.Index(fields=["rsi"], name="api_inv_rsi_idx"),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - simple data representation
         return self.ticker
@@ -95,6 +116,16 @@ class FinancialStatement(models.Model):
             "statement_type",
             "target_currency",
         )
+        indexes = [
+            # Matches the UPPER() comparisons behind the viewset's __iexact filters;
+            # symbol leads, so symbol-only lookups use the same index.
+            models.Index(
+                Upper("symbol"),
+                Upper("period_type"),
+                Upper("statement_type"),
+                name="api_finstmt_lookup_upper_idx",
+            ),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - simple data representation
         return (
@@ -106,8 +137,8 @@ class FinancialStatement(models.Model):
 class DueDiligenceReport(models.Model):
     """Stores structured AI due diligence reports for a symbol."""
 
-    symbol = models.CharField(max_length=16, db_index=True)
-    rating = models.CharField(max_length=16, db_index=True)
+    symbol = models.CharField(max_length=16)
+    rating = models.CharField(max_length=16)
     confidence = models.FloatField(null=True, blank=True)
     model_name = models.CharField(max_length=64, blank=True, default="")
     report = models.JSONField()
@@ -116,6 +147,13 @@ class DueDiligenceReport(models.Model):
 
     class Meta:
         ordering = ["-created_at", "symbol"]
+        indexes = [
+            # Matches the UPPER() comparisons behind symbol__iexact/rating__iexact.
+            # rating is a small BUY/HOLD/SELL set, so it only trails symbol here.
+            models.Index(
+                Upper("symbol"), Upper("rating"), name="api_ddreport_sym_rating_up_idx"
+            ),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - simple data representation
         return f"{self.symbol} {self.rating} ({self.created_at:%Y-%m-%d})"
@@ -1,17 +1,20 @@
 from datetime import date, datetime
 from decimal import Decimal
+from functools import cache
 from io import StringIO
 import json
 
-import requests
 from django.core.management import call_command
 from django.core.management.base import CommandError
+from django.db.models import Prefetch
+from django.test import SimpleTestCase, TestCase
 from django.urls import reverse
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.test import APISimpleTestCase, APITestCase
 from unittest.mock import MagicMock, call, patch
 
-from api.custom_filters import CUSTOM_FILTER_PAYLOAD, CUSTOM_FILTER_PAYLOAD_V2
+from api.custom_filters import CUSTOM_FILTER_PAYLOAD
 from api.management.commands.fetch_profile_data import (
     API_HEADERS,
     OPTION_EXPIRATIONS_ENDPOINT,
@@ -19,12 +22,127 @@ from api.management.commands.fetch_profile_data import (
 )
 
 from .models import Investment, ScreenerFilter, ScreenerType
+from .views import InvestmentViewSet
+
+
+# Response payloads shared across tests. The commands under test only read
+# these, so a single module-level instance is reused instead of rebuilding the
+# literals on every call.
+_VALUE_STOCKS_PAYLOAD = {
+    "data": [
+        {
+            "attributes": {
+                "name": "Value Stocks",
+                "description": "Stocks filtered by valuation metrics.",
+                "filters": [
+                    {
+                        "field": "pe_ratio",
+                        "operator": "<",
+                        "value": 15,
+                    },
+                    {
+                        "field": "market_cap",
+                        "operator": ">=",
+                        "value": 500_000_000,
+                    },
+                ],
+            }
+        },
+        {
+            "attributes": {
+                "name": "Growth Picks",
+                "shortDescription": "High growth companies.",
+                "filters": [
+                    {
+                        "industryId": 999,
+                    },
+                    {
+                        "field": "revenue_growth",
+                        "operator": ">",
+                        "value": 0.2,
+                        "industryId": 999,
+                    },
+                ],
+            }
+        },
+    ]
+}
+
+_AAA_PROFILE = [{"ticker": "AAA", "weekly_options": True}]
+_AAA_BBB_PROFILE = [
+    {"ticker": "AAA", "weekly_options": True},
+    {"ticker": "BBB", "weekly_options": True},
+]
+_AAA_BBB_CCC_PROFILE = [
+    {"ticker": "AAA", "weekly_options": True},
+    {"ticker": "BBB", "weekly_options": True},
+    {"ticker": "CCC", "weekly_options": True},
+]
+_AAA_WEEKLY_BBB_DAILY_PROFILE = [
+    {"ticker": "AAA", "weekly_options": True},
+    {"ticker": "BBB", "weekly_options": False},
+]
+_NEW1_PROFILE = [{"ticker": "NEW1", "weekly_options": True}]
+_NEW1_NEW2_PROFILE = [
+    {"ticker": "NEW1", "weekly_options": True},
+    {"ticker": "NEW2", "weekly_options": True},
+]
+_NEW1_NEW2_TICKERS = ("NEW1", "NEW2")
+_EMPTY_OPTION_EXPIRATIONS_PAYLOAD = {"data": {"attributes": {"dates": [], "ticker_id": 1}}}
+
+
+class _FakeResponse:
+    """Minimal stand-in for ``requests.Response`` returned by patched HTTP calls."""
+
+    __slots__ = ("status_code", "text", "headers", "_payload")
+
+    def __init__(self, payload, status: int = 200, text: str = "{}") -> None:
+        self.status_code = status
+        self.text = text
+        self.headers = {}
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+# Most FetchProfileDataCommandTests only need the single weekly "AAA" profile
+# response. Kept at module level: setUpTestData attributes are deep-copied per test.
+_AAA_RESPONSE = _FakeResponse(_AAA_PROFILE)
+
+
+@cache
+def _screener_results_response(*names: str) -> _FakeResponse:
+    """Return a screener results page listing ``names``, shared across tests."""
+
+    return _FakeResponse({"data": [{"attributes": {"name": name}} for name in names]})
+
+
+def _call_command_silently(*args, **options):
+    """Run ``call_command`` with its stdout/stderr captured unless a test passes its own.
+
+    The commands report progress through ``self.stdout``/``self.stderr`` (payload
+    dumps, RapidAPI fetch counts, skipped symbols), which would otherwise flood the
+    test output.
+    """
+
+    options.setdefault("stdout", StringIO())
+    options.setdefault("stderr", StringIO())
+    return call_command(*args, **options)
+
+
+class _TwoPerPagePagination(PageNumberPagination):
+    page_size = 2
 
 
 class InvestmentAPITestCase(APITestCase):
-    def setUp(self) -> None:
-        self.list_url = reverse("investment-list")
-        self.detail_url_name = "investment-detail"
+    detail_url_name = "investment-detail"
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        # reverse_lazy re-resolves on every use; resolve once per class instead.
+        cls.list_url = reverse("investment-list")
 
     def create_investment(self, **overrides):
         defaults = {
@@ -48,7 +166,7 @@ class InvestmentAPITestCase(APITestCase):
             "market_cap": 12_000_000,
         }
 
-        response = self.client.post(self.list_url, payload, format="json")
+        response = self.client.post(self.list_url, payload)
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(Investment.objects.count(), 1)
@@ -57,7 +175,8 @@ class InvestmentAPITestCase(APITestCase):
     def test_list_returns_created_items(self) -> None:
         self.create_investment(ticker="BND", category="ETF")
 
-        response = self.client.get(self.list_url)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.list_url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
@@ -142,6 +261,43 @@ class InvestmentAPITestCase(APITestCase):
             {item["ticker"] for item in response.data["results"]}, {"CSTM1", "CSTM2"}
         )
 
+    def test_list_custom_screener_filter_ignores_repeated_spaces(self) -> None:
+        custom_screener = "Custom screener filter"
+        self.create_investment(ticker="CSTM1", screener_type=custom_screener)
+        self.create_investment(ticker="OTHER", screener_type="Another Screener")
+
+        response = self.client.get(
+            self.list_url, {"screener_type": "custom  screener   filter"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(response.data["results"][0]["ticker"], "CSTM1")
+
+    def test_list_treats_blank_screener_type_as_absent(self) -> None:
+        self.create_investment(ticker="BND", screener_type="Growth")
+        self.create_investment(ticker="GRW", screener_type="Value")
+
+        response = self.client.get(self.list_url, {"screener_type": "   "})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item["ticker"] for item in response.data], ["BND", "GRW"])
+
+    @patch.object(InvestmentViewSet, "pagination_class", _TwoPerPagePagination)
+    def test_list_custom_screener_filter_is_paginated_when_configured(self) -> None:
+        custom_screener = "Custom screener filter"
+        for ticker in ("CSTM1", "CSTM2", "CSTM3"):
+            self.create_investment(ticker=ticker, screener_type=custom_screener)
+
+        response = self.client.get(self.list_url, {"screener_type": custom_screener})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 3)
+        self.assertEqual(
+            [item["ticker"] for item in response.data["results"]], ["CSTM1", "CSTM2"]
+        )
+        self.assertIsNotNone(response.data["next"])
+
     def test_legacy_screenter_type_query_param_is_supported(self) -> None:
         self.create_investment(ticker="BND", category="ETF", screener_type="Growth")
         self.create_investment(ticker="GRW", category="Fund", screener_type="Value")
@@ -172,6 +328,25 @@ class InvestmentAPITestCase(APITestCase):
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]["ticker"], "MID")
 
+    def test_can_update_investment(self) -> None:
+        investment = self.create_investment()
+        url = reverse(self.detail_url_name, args=[investment.id])
+
+        response = self.client.patch(url, {"price": "15.42"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        investment.refresh_from_db()
+        self.assertEqual(str(investment.price), "15.4200")
+
+
+class InvestmentAPIValidationTests(APISimpleTestCase):
+    """Requests rejected during validation, before any query is issued."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.list_url = reverse("investment-list")
+
     def test_list_rejects_invalid_numeric_filters(self) -> None:
         response = self.client.get(self.list_url, {"min_price": "abc"})
 
@@ -186,15 +361,23 @@ class InvestmentAPITestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("options_suitability", response.data)
 
-    def test_can_update_investment(self) -> None:
-        investment = self.create_investment()
-        url = reverse(self.detail_url_name, args=[investment.id])
+    def test_list_rejects_oversized_integer_filters(self) -> None:
+        # int() refuses digit strings past the interpreter's conversion limit.
+        for param in ("min_volume", "options_suitability"):
+            with self.subTest(param=param):
+                response = self.client.get(self.list_url, {param: "1" * 5000})
 
-        response = self.client.patch(url, {"price": "15.42"}, format="json")
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn(param, response.data)
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        investment.refresh_from_db()
-        self.assertEqual(str(investment.price), "15.4200")
+    def test_list_reports_every_invalid_filter_together(self) -> None:
+        response = self.client.get(
+            self.list_url,
+            {"min_price": "abc", "min_volume": "many", "weekly_options": "maybe"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(response.data), {"min_price", "min_volume", "weekly_options"})
 
     def test_cannot_create_invalid_investment(self) -> None:
         response = self.client.post(
@@ -203,7 +386,6 @@ class InvestmentAPITestCase(APITestCase):
                 "ticker": "",
                 "category": "Fund",
             },
-            format="json",
         )
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -211,13 +393,15 @@ class InvestmentAPITestCase(APITestCase):
 
 
 class ScreenerTypeAPITestCase(APITestCase):
-    def setUp(self) -> None:
-        self.list_url = reverse("screenertype-list")
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.list_url = reverse("screenertype-list")
 
     def test_can_create_screener_type(self) -> None:
         payload = {"name": "Top Gainers", "description": "Daily top performing stocks."}
 
-        response = self.client.post(self.list_url, payload, format="json")
+        response = self.client.post(self.list_url, payload)
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(ScreenerType.objects.count(), 1)
@@ -240,7 +424,9 @@ class ScreenerTypeAPITestCase(APITestCase):
             display_order=1,
         )
 
-        response = self.client.get(self.list_url)
+        # One query for the screener types and one for the prefetched filters.
+        with self.assertNumQueries(2):
+            response = self.client.get(self.list_url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
@@ -250,11 +436,28 @@ class ScreenerTypeAPITestCase(APITestCase):
         self.assertEqual(filters[0]["label"], "P/E < 15")
         self.assertEqual(filters[1]["label"], "Market Cap >= 500M")
 
+    def test_destroy_skips_filters_prefetch(self) -> None:
+        screener_type = ScreenerType.objects.create(name="Dividend", description="")
+        ScreenerFilter.objects.create(screener_type=screener_type, label="Yield > 3%")
+        url = reverse("screenertype-detail", args=[screener_type.id])
+
+        # Lookup plus the two cascade deletes; the filters prefetch is skipped.
+        with self.assertNumQueries(3):
+            response = self.client.delete(url)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(ScreenerType.objects.filter(pk=screener_type.pk).exists())
+
 
 class ScreenerFilterAPITestCase(APITestCase):
-    def setUp(self) -> None:
-        self.screener_type = ScreenerType.objects.create(name="Momentum", description="")
-        self.list_url = reverse("screenerfilter-list")
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.screener_type = ScreenerType.objects.create(name="Momentum", description="")
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.list_url = reverse("screenerfilter-list")
 
     def test_can_create_filter(self) -> None:
         payload = {
@@ -264,7 +467,7 @@ class ScreenerFilterAPITestCase(APITestCase):
             "display_order": 5,
         }
 
-        response = self.client.post(self.list_url, payload, format="json")
+        response = self.client.post(self.list_url, payload)
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(ScreenerFilter.objects.count(), 1)
@@ -276,13 +479,13 @@ class ScreenerFilterAPITestCase(APITestCase):
     def test_cannot_create_filter_with_blank_label(self) -> None:
         payload = {"screener_type": self.screener_type.id, "label": "   "}
 
-        response = self.client.post(self.list_url, payload, format="json")
+        response = self.client.post(self.list_url, payload)
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("label", response.data)
 
 
-class FetchScreenersCommandTests(APITestCase):
+class FetchScreenersCommandTests(TestCase):
     def _assert_custom_filter(self, name: str, payload: dict) -> None:
         custom_screener = ScreenerType.objects.get(name=name)
         custom_filters = list(custom_screener.filters.order_by("display_order"))
@@ -293,57 +496,22 @@ class FetchScreenersCommandTests(APITestCase):
 
     @patch("api.management.commands.fetch_screeners.requests.get")
     def test_fetch_and_persist_screeners(self, mock_get: MagicMock) -> None:
-        mock_get.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {
-                "data": [
-                    {
-                        "attributes": {
-                            "name": "Value Stocks",
-                            "description": "Stocks filtered by valuation metrics.",
-                            "filters": [
-                                {
-                                    "field": "pe_ratio",
-                                    "operator": "<",
-                                    "value": 15,
-                                },
-                                {
-                                    "field": "market_cap",
-                                    "operator": ">=",
-                                    "value": 500_000_000,
-                                },
-                            ],
-                        }
-                    },
-                    {
-                        "attributes": {
-                            "name": "Growth Picks",
-                            "shortDescription": "High growth companies.",
-                            "filters": [
-                                {
-                                    "industryId": 999,
-                                },
-                                {
-                                    "field": "revenue_growth",
-                                    "operator": ">",
-                                    "value": 0.2,
-                                    "industryId": 999,
-                                },
-                            ],
-                        }
-                    },
-                ]
-            },
-            text="{}",
-        )
+        mock_get.return_value = _FakeResponse(_VALUE_STOCKS_PAYLOAD)
 
-        call_command("fetch_screeners")
+        _call_command_silently("fetch_screeners")
 
-        self.assertEqual(ScreenerType.objects.count(), 4)
-        screener = ScreenerType.objects.get(name="Value Stocks")
+        screeners = ScreenerType.objects.prefetch_related(
+            Prefetch(
+                "filters",
+                queryset=ScreenerFilter.objects.order_by("display_order"),
+                to_attr="ordered_filters",
+            )
+        ).in_bulk(field_name="name")
+        self.assertEqual(len(screeners), 3)
+        screener = screeners["Value Stocks"]
         self.assertEqual(screener.description, "Stocks filtered by valuation metrics.")
 
-        filters = list(screener.filters.order_by("display_order"))
+        filters = screener.ordered_filters
         self.assertEqual(len(filters), 2)
         self.assertEqual(filters[0].label, "field=pe_ratio, operator=<, value=15")
         self.assertEqual(
@@ -359,9 +527,9 @@ class FetchScreenersCommandTests(APITestCase):
         )
         self.assertEqual(filters[1].display_order, 2)
 
-        second = ScreenerType.objects.get(name="Growth Picks")
+        second = screeners["Growth Picks"]
         self.assertEqual(second.description, "High growth companies.")
-        filters = list(second.filters.order_by("display_order"))
+        filters = second.ordered_filters
         self.assertEqual(len(filters), 2)
 
         industry_filter = filters[0]
@@ -388,7 +556,6 @@ class FetchScreenersCommandTests(APITestCase):
         self.assertEqual(filters[1].display_order, 2)
 
         self._assert_custom_filter("Custom screener filter", CUSTOM_FILTER_PAYLOAD)
-        self._assert_custom_filter("Custom screener filterV2", CUSTOM_FILTER_PAYLOAD_V2)
 
     @patch("api.management.commands.fetch_screeners.requests.get")
     def test_command_removes_missing_filters(self, mock_get: MagicMock) -> None:
@@ -400,9 +567,8 @@ class FetchScreenersCommandTests(APITestCase):
             display_order=1,
         )
 
-        mock_get.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {
+        mock_get.return_value = _FakeResponse(
+            {
                 "data": [
                     {
                         "attributes": {
@@ -412,11 +578,10 @@ class FetchScreenersCommandTests(APITestCase):
                         }
                     }
                 ]
-            },
-            text="{}",
+            }
         )
 
-        call_command("fetch_screeners")
+        _call_command_silently("fetch_screeners")
 
         screener.refresh_from_db()
         self.assertEqual(screener.description, "Updated description.")
@@ -427,13 +592,11 @@ class FetchScreenersCommandTests(APITestCase):
         self.assertEqual(filters[0].display_order, 1)
 
         self._assert_custom_filter("Custom screener filter", CUSTOM_FILTER_PAYLOAD)
-        self._assert_custom_filter("Custom screener filterV2", CUSTOM_FILTER_PAYLOAD_V2)
 
     @patch("api.management.commands.fetch_screeners.requests.get")
     def test_command_trims_quant_rating_values(self, mock_get: MagicMock) -> None:
-        mock_get.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {
+        mock_get.return_value = _FakeResponse(
+            {
                 "data": [
                     {
                         "attributes": {
@@ -453,11 +616,10 @@ class FetchScreenersCommandTests(APITestCase):
                         }
                     }
                 ]
-            },
-            text="{}",
+            }
         )
 
-        call_command("fetch_screeners")
+        _call_command_silently("fetch_screeners")
 
         screener = ScreenerType.objects.get(name="Stocks by Quant")
         self.assertEqual(screener.description, "Quant focused screener.")
@@ -474,15 +636,13 @@ class FetchScreenersCommandTests(APITestCase):
         )
 
         self._assert_custom_filter("Custom screener filter", CUSTOM_FILTER_PAYLOAD)
-        self._assert_custom_filter("Custom screener filterV2", CUSTOM_FILTER_PAYLOAD_V2)
 
     @patch("api.management.commands.fetch_screeners.requests.get")
     def test_command_removes_industry_id_from_quant_screener(
         self, mock_get: MagicMock
     ) -> None:
-        mock_get.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {
+        mock_get.return_value = _FakeResponse(
+            {
                 "data": [
                     {
                         "attributes": {
@@ -498,11 +658,10 @@ class FetchScreenersCommandTests(APITestCase):
                         }
                     }
                 ]
-            },
-            text="{}",
+            }
         )
 
-        call_command("fetch_screeners")
+        _call_command_silently("fetch_screeners")
 
         screener = ScreenerType.objects.get(name="Stocks by Quant")
         filters = list(screener.filters.order_by("display_order"))
@@ -515,20 +674,18 @@ class FetchScreenersCommandTests(APITestCase):
         self.assertNotIn("industry_id", json.dumps(filters[0].payload))
 
 
-class FetchTickerNamesCommandTests(APITestCase):
+class FetchTickerNamesCommandTests(SimpleTestCase):
     @patch("api.management.commands.fetch_ticker_names.requests.get")
     def test_command_returns_tickers_from_endpoint(self, mock_get: MagicMock) -> None:
-        mock_get.return_value = MagicMock(
-            status_code=200,
-            json=lambda: [
+        mock_get.return_value = _FakeResponse(
+            [
                 {"ticker": "AAA"},
                 {"ticker": "BBB"},
-            ],
-            text="{}",
+            ]
         )
 
         buffer = StringIO()
-        result = call_command("fetch_ticker_names", stdout=buffer)
+        result = _call_command_silently("fetch_ticker_names", stdout=buffer)
 
         mock_get.assert_called_once_with(
             "http://127.0.0.1:8000/api/investments/",
@@ -540,21 +697,22 @@ class FetchTickerNamesCommandTests(APITestCase):
 
     @patch("api.management.commands.fetch_ticker_names.requests.get")
     def test_command_errors_when_no_tickers_found(self, mock_get: MagicMock) -> None:
-        mock_get.return_value = MagicMock(status_code=200, json=lambda: [], text="[]")
+        mock_get.return_value = _FakeResponse([], text="[]")
 
         with self.assertRaisesMessage(
             CommandError, "No ticker names were found in the response payload."
         ):
-            call_command("fetch_ticker_names")
+            _call_command_silently("fetch_ticker_names")
 
 
-class FetchScreenerResultsCommandTests(APITestCase):
-    def setUp(self) -> None:
-        self.screener = ScreenerType.objects.create(
+class FetchScreenerResultsCommandTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.screener = ScreenerType.objects.create(
             name="Value Stocks", description="Stocks filtered by valuation metrics."
         )
         ScreenerFilter.objects.create(
-            screener_type=self.screener,
+            screener_type=cls.screener,
             label="Market Cap >= 500M",
             payload={"field": "market_cap", "operator": ">=", "value": 500_000_000},
             display_order=1,
@@ -562,20 +720,18 @@ class FetchScreenerResultsCommandTests(APITestCase):
 
     @patch("api.management.commands.fetch_screener_results.requests.post")
     def test_command_creates_investments_from_tickers(self, mock_post: MagicMock) -> None:
-        mock_post.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {
+        mock_post.return_value = _FakeResponse(
+            {
                 "data": [
                     {"attributes": {"p": {"names": ["Apple Inc."]}}},
                     {"attributes": {"p": {"name": "Microsoft Corporation"}}},
                     {"attributes": {"name": "Tesla, Inc."}},
                 ]
-            },
-            text="{}",
+            }
         )
 
         buffer = StringIO()
-        result = call_command(
+        result = _call_command_silently(
             "fetch_screener_results", screener_name=self.screener.name, stdout=buffer
         )
 
@@ -583,8 +739,8 @@ class FetchScreenerResultsCommandTests(APITestCase):
         self.assertEqual(result, expected_output)
         self.assertEqual(buffer.getvalue(), expected_output + "\n")
 
-        tickers = Investment.objects.order_by("ticker").values_list("ticker", flat=True)
-        self.assertEqual(list(tickers), ["Apple Inc.", "Microsoft Corporation", "Tesla, Inc."])
+        tickers = sorted(Investment.objects.order_by().values_list("ticker", flat=True))
+        self.assertEqual(tickers, ["Apple Inc.", "Microsoft Corporation", "Tesla, Inc."])
         self.assertTrue(
             Investment.objects.filter(ticker="Apple Inc.", category="stock").exists()
         )
@@ -603,23 +759,14 @@ class FetchScreenerResultsCommandTests(APITestCase):
         mock_rsi_value: MagicMock,
         mock_weekly_tickers: MagicMock,
     ) -> None:
-        mock_post.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {
-                "data": [
-                    {"attributes": {"name": "WEEKLY"}},
-                    {"attributes": {"name": "DAILY"}},
-                ]
-            },
-            text="{}",
-        )
+        mock_post.return_value = _screener_results_response("WEEKLY", "DAILY")
         mock_weekly_tickers.return_value = {"WEEKLY"}
         mock_profile_payload.return_value = {
             "data": {"attributes": {"price": {"last": "123.45"}}}
         }
         mock_rsi_value.return_value = Decimal("55.67")
 
-        call_command("fetch_screener_results", screener_name=self.screener.name)
+        _call_command_silently("fetch_screener_results", screener_name=self.screener.name)
 
         weekly_investment = Investment.objects.get(ticker="WEEKLY")
         self.assertTrue(weekly_investment.weekly_options)
@@ -644,14 +791,10 @@ class FetchScreenerResultsCommandTests(APITestCase):
         mock_rsi_value: MagicMock,
         mock_weekly_tickers: MagicMock,
     ) -> None:
-        mock_post.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {"data": [{"attributes": {"name": "UNKNOWN"}}]},
-            text="{}",
-        )
+        mock_post.return_value = _screener_results_response("UNKNOWN")
         mock_weekly_tickers.return_value = None
 
-        call_command("fetch_screener_results", screener_name=self.screener.name)
+        _call_command_silently("fetch_screener_results", screener_name=self.screener.name)
 
         investment = Investment.objects.get(ticker="UNKNOWN")
         self.assertIsNone(investment.weekly_options)
@@ -664,19 +807,10 @@ class FetchScreenerResultsCommandTests(APITestCase):
     def test_command_prints_count_for_custom_screener(
         self, mock_post: MagicMock
     ) -> None:
-        mock_post.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {
-                "data": [
-                    {"attributes": {"name": "Alpha Corp"}},
-                    {"attributes": {"name": "Beta LLC"}},
-                ]
-            },
-            text="{}",
-        )
+        mock_post.return_value = _screener_results_response("Alpha Corp", "Beta LLC")
 
         buffer = StringIO()
-        result = call_command(
+        result = _call_command_silently(
             "fetch_screener_results",
             screener_name="Custom screener filter",
             stdout=buffer,
@@ -691,24 +825,14 @@ class FetchScreenerResultsCommandTests(APITestCase):
 
     @patch("api.management.commands.fetch_screener_results.requests.post")
     def test_command_fetches_multiple_pages(self, mock_post: MagicMock) -> None:
-        def build_response(names: list[str]) -> MagicMock:
-            payload = {
-                "data": [
-                    {"attributes": {"name": company_name}} for company_name in names
-                ]
-            }
-            response = MagicMock(status_code=200, text="{}")
-            response.json.return_value = payload
-            return response
-
         mock_post.side_effect = [
-            build_response(["Alpha Corp"]),
-            build_response(["Beta LLC"]),
-            build_response([]),
+            _screener_results_response("Alpha Corp"),
+            _screener_results_response("Beta LLC"),
+            _screener_results_response(),
         ]
 
         buffer = StringIO()
-        result = call_command(
+        result = _call_command_silently(
             "fetch_screener_results",
             screener_name=self.screener.name,
             per_page=1,
@@ -725,8 +849,8 @@ class FetchScreenerResultsCommandTests(APITestCase):
         self.assertEqual(result, expected_output)
         self.assertEqual(buffer.getvalue(), expected_output + "\n")
 
-        tickers = Investment.objects.order_by("ticker").values_list("ticker", flat=True)
-        self.assertEqual(list(tickers), ["Alpha Corp", "Beta LLC"])
+        tickers = sorted(Investment.objects.order_by().values_list("ticker", flat=True))
+        self.assertEqual(tickers, ["Alpha Corp", "Beta LLC"])
 
     @patch("api.management.commands.fetch_screener_results.requests.post")
     def test_command_replaces_existing_screener_entries(self, mock_post: MagicMock) -> None:
@@ -737,13 +861,9 @@ class FetchScreenerResultsCommandTests(APITestCase):
             ticker="Keep", category="stock", screener_type="Another Screener"
         )
 
-        mock_post.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {"data": [{"attributes": {"name": "Fresh"}}]},
-            text="{}",
-        )
+        mock_post.return_value = _screener_results_response("Fresh")
 
-        call_command("fetch_screener_results", screener_name=self.screener.name)
+        _call_command_silently("fetch_screener_results", screener_name=self.screener.name)
 
         self.assertFalse(
             Investment.objects.filter(
@@ -769,17 +889,15 @@ class FetchScreenerResultsCommandTests(APITestCase):
             description="",
         )
 
-        mock_post.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {
+        mock_post.return_value = _FakeResponse(
+            {
                 "data": [
                     {"attributes": {"p": {"names": ["Apple Inc."]}}},
                 ]
-            },
-            text="{}",
+            }
         )
 
-        call_command(
+        _call_command_silently(
             "fetch_screener_results",
             screener_name=self.screener.name,
             asset_type="fund",
@@ -791,17 +909,16 @@ class FetchScreenerResultsCommandTests(APITestCase):
 
     @patch("api.management.commands.fetch_screener_results.requests.post")
     def test_command_applies_market_cap_argument(self, mock_post: MagicMock) -> None:
-        mock_post.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {"data": [{"attributes": {"name": "Example"}}]},
-            text="{}",
-        )
+        mock_post.return_value = _screener_results_response("Example")
 
         buffer = StringIO()
-        call_command(
+        # Passes argv-style options to cover the flag spellings, not just the dests.
+        _call_command_silently(
             "fetch_screener_results",
-            screener_name=self.screener.name,
-            market_cap="10B",
+            "--screener_name",
+            self.screener.name,
+            "--market-cap",
+            "10B",
             stdout=buffer,
         )
 
@@ -816,13 +933,9 @@ class FetchScreenerResultsCommandTests(APITestCase):
 
     @patch("api.management.commands.fetch_screener_results.requests.post")
     def test_command_applies_price_arguments(self, mock_post: MagicMock) -> None:
-        mock_post.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {"data": [{"attributes": {"name": "Sample"}}]},
-            text="{}",
-        )
+        mock_post.return_value = _screener_results_response("Sample")
 
-        call_command(
+        _call_command_silently(
             "fetch_screener_results",
             screener_name=self.screener.name,
             min_price="10",
@@ -839,13 +952,9 @@ class FetchScreenerResultsCommandTests(APITestCase):
     def test_command_does_not_merge_custom_filter_for_standard_screeners(
         self, mock_post: MagicMock
     ) -> None:
-        mock_post.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {"data": [{"attributes": {"name": "Sample"}}]},
-            text="{}",
-        )
+        mock_post.return_value = _screener_results_response("Sample")
 
-        call_command(
+        _call_command_silently(
             "fetch_screener_results",
             screener_name=self.screener.name,
         )
@@ -873,13 +982,9 @@ class FetchScreenerResultsCommandTests(APITestCase):
             display_order=1,
         )
 
-        mock_post.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {"data": [{"attributes": {"name": "Sample"}}]},
-            text="{}",
-        )
+        mock_post.return_value = _screener_results_response("Sample")
 
-        call_command(
+        _call_command_silently(
             "fetch_screener_results",
             screener_name=custom_screener.name,
             market_cap="7B",
@@ -896,43 +1001,6 @@ class FetchScreenerResultsCommandTests(APITestCase):
         self.assertEqual(payload["close"].get("gte"), 15.0)
         self.assertEqual(payload["marketcap_display"].get("gte"), 7_000_000_000)
 
-    @patch("api.management.commands.fetch_screener_results.requests.post")
-    def test_command_includes_custom_filter_v2(self, mock_post: MagicMock) -> None:
-        custom_screener = ScreenerType.objects.create(
-            name="Custom screener filterV2",
-            description="Custom filter payload V2 only.",
-        )
-        ScreenerFilter.objects.create(
-            screener_type=custom_screener,
-            label="Base filters",
-            payload={"close": {"lte": 25}},
-            display_order=1,
-        )
-
-        mock_post.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {"data": [{"attributes": {"name": "Sample"}}]},
-            text="{}",
-        )
-
-        call_command(
-            "fetch_screener_results",
-            screener_name=custom_screener.name,
-            market_cap="6B",
-            min_price="10",
-        )
-
-        _, kwargs = mock_post.call_args
-        payload = kwargs["json"]
-
-        self.assertEqual(payload.get("exchange"), CUSTOM_FILTER_PAYLOAD_V2["exchange"])
-        self.assertIn("marketcap_display", payload)
-        self.assertEqual(payload["marketcap_display"].get("gte"), 6_000_000_000)
-        self.assertIn("quant_rating", payload)
-        self.assertNotIn("altman_z_score", payload)
-        self.assertEqual(payload["close"].get("lte"), 25)
-        self.assertEqual(payload["close"].get("gte"), 10.0)
-
     @patch("api.management.commands.fetch_screener_results.requests.post")
     def test_command_removes_industry_id_for_quant_screener(
         self, mock_post: MagicMock
@@ -951,13 +1019,9 @@ class FetchScreenerResultsCommandTests(APITestCase):
             display_order=1,
         )
 
-        mock_post.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {"data": [{"attributes": {"name": "Sample"}}]},
-            text="{}",
-        )
+        mock_post.return_value = _screener_results_response("Sample")
 
-        call_command(
+        _call_command_silently(
             "fetch_screener_results",
             screener_name=quant_screener.name,
             market_cap="5B",
@@ -987,13 +1051,9 @@ class FetchScreenerResultsCommandTests(APITestCase):
             display_order=1,
         )
 
-        mock_post.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {"data": [{"attributes": {"name": "Sample"}}]},
-            text="{}",
-        )
+        mock_post.return_value = _screener_results_response("Sample")
 
-        call_command(
+        _call_command_silently(
             "fetch_screener_results",
             screener_name=nested_screener.name,
             market_cap="5B",
@@ -1023,13 +1083,9 @@ class FetchScreenerResultsCommandTests(APITestCase):
             display_order=1,
         )
 
-        mock_post.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {"data": [{"attributes": {"name": "Sample"}}]},
-            text="{}",
-        )
+        mock_post.return_value = _screener_results_response("Sample")
 
-        call_command(
+        _call_command_silently(
             "fetch_screener_results",
             screener_name=quant_screener.name,
             quant_rating="strong_buy",
@@ -1057,13 +1113,9 @@ class FetchScreenerResultsCommandTests(APITestCase):
             display_order=1,
         )
 
-        mock_post.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {"data": [{"attributes": {"name": "Sample"}}]},
-            text="{}",
-        )
+        mock_post.return_value = _screener_results_response("Sample")
 
-        call_command(
+        _call_command_silently(
             "fetch_screener_results",
             screener_name=quant_screener.name,
             quant_rating="strong_buy",
@@ -1090,13 +1142,9 @@ class FetchScreenerResultsCommandTests(APITestCase):
             payload={},
             display_order=1,
         )
-        mock_post.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {"data": [{"attributes": {"name": "Sample"}}]},
-            text="{}",
-        )
+        mock_post.return_value = _screener_results_response("Sample")
 
-        call_command(
+        _call_command_silently(
             "fetch_screener_results",
             screener_name=custom_screener.name,
             quant_rating="strong_buy",
@@ -1110,7 +1158,7 @@ class FetchScreenerResultsCommandTests(APITestCase):
 
     def test_command_rejects_invalid_market_cap_argument(self) -> None:
         with self.assertRaisesMessage(CommandError, "Market cap value must be a number optionally followed by K, M, B, or T."):
-            call_command(
+            _call_command_silently(
                 "fetch_screener_results",
                 screener_name=self.screener.name,
                 market_cap="ten-billion",
@@ -1118,14 +1166,14 @@ class FetchScreenerResultsCommandTests(APITestCase):
 
     def test_command_rejects_invalid_price_arguments(self) -> None:
         with self.assertRaisesMessage(CommandError, "Price filters must be numeric values."):
-            call_command(
+            _call_command_silently(
                 "fetch_screener_results",
                 screener_name=self.screener.name,
                 min_price="ten",
             )
 
         with self.assertRaisesMessage(CommandError, "Minimum price cannot be greater than maximum price."):
-            call_command(
+            _call_command_silently(
                 "fetch_screener_results",
                 screener_name=self.screener.name,
                 min_price="50",
@@ -1134,29 +1182,26 @@ class FetchScreenerResultsCommandTests(APITestCase):
 
     @patch("api.management.commands.fetch_screener_results.requests.post")
     def test_command_errors_when_no_names_present(self, mock_post: MagicMock) -> None:
-        mock_post.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {"data": [{"attributes": {"p": {}}}]},
-            text="{}",
-        )
+        mock_post.return_value = _FakeResponse({"data": [{"attributes": {"p": {}}}]})
 
         with self.assertRaisesMessage(
             CommandError, "Seeking Alpha API response did not include any ticker names."
         ):
-            call_command(
-                "fetch_screener_results", screener_name=self.screener.name
-            )
+            _call_command_silently("fetch_screener_results", screener_name=self.screener.name)
 
 
-class FetchProfileDataCommandTests(APITestCase):
+class FetchProfileDataCommandTests(TestCase):
+    screener_name = "Growth"
 
-    def setUp(self) -> None:
-        self.screener_name = "Growth"
-        self.investments = [
-            Investment.objects.create(ticker="AAA", category="stock"),
-            Investment.objects.create(ticker="BBB", category="stock"),
-            Investment.objects.create(ticker="CCC", category="stock"),
-        ]
+    @classmethod
+    def setUpTestData(cls) -> None:
+        Investment.objects.bulk_create(
+            [
+                Investment(ticker="AAA", category="stock"),
+                Investment(ticker="BBB", category="stock"),
+                Investment(ticker="CCC", category="stock"),
+            ]
+        )
 
     def _build_next_month_dates(self, days: list[int]) -> list[str]:
         today = date.today()
@@ -1173,7 +1218,7 @@ class FetchProfileDataCommandTests(APITestCase):
         return datetime.strptime(value, "%m/%d/%Y").date()
 
     @patch("api.management.commands.fetch_profile_data.Command._fetch_option_expirations")
-    @patch("api.management.commands.fetch_profile_data.requests.get")
+    @patch("api.management.commands.fetch_profile_data.requests.Session.get")
     def test_command_sets_option_exp_with_three_expirations(
         self, mock_get: MagicMock, mock_expirations: MagicMock
     ) -> None:
@@ -1181,13 +1226,9 @@ class FetchProfileDataCommandTests(APITestCase):
             "dates": self._build_next_month_dates([5, 12, 19]),
             "ticker_id": "AAA",
         }
-        mock_get.return_value = MagicMock(
-            status_code=200,
-            json=lambda: [{"ticker": "AAA", "weekly_options": True}],
-            text="{}",
-        )
+        mock_get.return_value = _AAA_RESPONSE
 
-        call_command("fetch_profile_data", screener_name=self.screener_name)
+        _call_command_silently("fetch_profile_data", screener_name=self.screener_name)
         investment = Investment.objects.get(ticker="AAA")
         expected_expiration = self._parse_date(
             mock_expirations.return_value["dates"][2]
@@ -1195,7 +1236,7 @@ class FetchProfileDataCommandTests(APITestCase):
         self.assertEqual(investment.option_exp, expected_expiration)
 
     @patch("api.management.commands.fetch_profile_data.Command._fetch_option_expirations")
-    @patch("api.management.commands.fetch_profile_data.requests.get")
+    @patch("api.management.commands.fetch_profile_data.requests.Session.get")
     def test_command_clears_option_exp_with_fewer_than_three_expirations(
         self, mock_get: MagicMock, mock_expirations: MagicMock
     ) -> None:
@@ -1203,121 +1244,93 @@ class FetchProfileDataCommandTests(APITestCase):
             "dates": self._build_next_month_dates([5, 12]),
             "ticker_id": "AAA",
         }
-        mock_get.return_value = MagicMock(
-            status_code=200,
-            json=lambda: [{"ticker": "AAA", "weekly_options": True}],
-            text="{}",
-        )
+        mock_get.return_value = _AAA_RESPONSE
 
-        call_command("fetch_profile_data", screener_name=self.screener_name)
+        _call_command_silently("fetch_profile_data", screener_name=self.screener_name)
         investment = Investment.objects.get(ticker="AAA")
         self.assertIsNone(investment.option_exp)
 
     @patch("api.management.commands.fetch_profile_data.Command._fetch_option_expirations")
-    @patch("api.management.commands.fetch_profile_data.requests.get")
+    @patch("api.management.commands.fetch_profile_data.requests.Session.get")
     def test_command_clears_option_exp_with_no_expirations(
         self, mock_get: MagicMock, mock_expirations: MagicMock
     ) -> None:
         mock_expirations.return_value = {"dates": [], "ticker_id": "AAA"}
-        mock_get.return_value = MagicMock(
-            status_code=200,
-            json=lambda: [{"ticker": "AAA", "weekly_options": True}],
-            text="{}",
-        )
+        mock_get.return_value = _AAA_RESPONSE
 
-        call_command("fetch_profile_data", screener_name=self.screener_name)
+        _call_command_silently("fetch_profile_data", screener_name=self.screener_name)
         investment = Investment.objects.get(ticker="AAA")
         self.assertIsNone(investment.option_exp)
 
     @patch("api.management.commands.fetch_profile_data.Command._fetch_option_expirations")
-    @patch("api.management.commands.fetch_profile_data.requests.get")
+    @patch("api.management.commands.fetch_profile_data.requests.Session.get")
     def test_command_creates_missing_investments(
         self, mock_get: MagicMock, mock_expirations: MagicMock
     ) -> None:
-        mock_get.return_value = MagicMock(
-            status_code=200,
-            json=lambda: [
-                {"ticker": "NEW1", "weekly_options": True},
-                {"ticker": "NEW2", "weekly_options": True},
-            ],
-            text="{}",
-        )
+        mock_get.return_value = _FakeResponse(_NEW1_NEW2_PROFILE)
         mock_expirations.return_value = {"dates": [], "ticker_id": "NEW"}
 
         buffer = StringIO()
-        call_command("fetch_profile_data", screener_name=self.screener_name, stdout=buffer)
+        _call_command_silently(
+            "fetch_profile_data", screener_name=self.screener_name, stdout=buffer
+        )
 
-        for ticker in ("NEW1", "NEW2"):
-            investment = Investment.objects.get(ticker=ticker)
-            self.assertEqual(investment.category, "stock")
-            self.assertIsNone(investment.price)
-            self.assertIsNone(investment.market_cap)
+        rows = Investment.objects.filter(ticker__in=_NEW1_NEW2_TICKERS).values_list(
+            "ticker", "category", "price", "market_cap"
+        )
+        self.assertEqual(
+            sorted(rows),
+            [(ticker, "stock", None, None) for ticker in _NEW1_NEW2_TICKERS],
+        )
 
-        output = buffer.getvalue()
-        self.assertIn("Created investment NEW1", output)
-        self.assertIn("Created investment NEW2", output)
+        self.assertRegex(
+            buffer.getvalue(), r"(?s)Created investment NEW1\b.*Created investment NEW2\b"
+        )
 
     @patch("api.management.commands.fetch_profile_data.Command._fetch_option_expirations")
-    @patch("api.management.commands.fetch_profile_data.requests.get")
+    @patch("api.management.commands.fetch_profile_data.requests.Session.get")
     def test_command_sets_investment_id_to_ticker_id_on_create(
         self, mock_get: MagicMock, mock_expirations: MagicMock
     ) -> None:
-        mock_get.return_value = MagicMock(
-            status_code=200,
-            json=lambda: [
-                {"ticker": "NEW1", "weekly_options": True},
-            ],
-            text="{}",
-        )
+        mock_get.return_value = _FakeResponse(_NEW1_PROFILE)
         mock_expirations.return_value = {"dates": [], "ticker_id": "1105"}
 
-        call_command("fetch_profile_data", screener_name=self.screener_name)
+        _call_command_silently("fetch_profile_data", screener_name=self.screener_name)
 
         investment = Investment.objects.get(ticker="NEW1")
         self.assertEqual(investment.id, 1105)
 
     @patch("api.management.commands.fetch_profile_data.Command._fetch_option_expirations")
-    @patch("api.management.commands.fetch_profile_data.requests.get")
+    @patch("api.management.commands.fetch_profile_data.requests.Session.get")
     def test_command_updates_investment_id_when_missing(
         self, mock_get: MagicMock, mock_expirations: MagicMock
     ) -> None:
-        mock_get.return_value = MagicMock(
-            status_code=200,
-            json=lambda: [{"ticker": "AAA", "weekly_options": True}],
-            text="{}",
-        )
+        mock_get.return_value = _AAA_RESPONSE
         mock_expirations.return_value = {"dates": [], "ticker_id": "9999"}
 
-        call_command("fetch_profile_data", screener_name=self.screener_name)
+        _call_command_silently("fetch_profile_data", screener_name=self.screener_name)
 
         investment = Investment.objects.get(ticker="AAA")
         self.assertEqual(investment.id, 9999)
 
-    @patch("api.management.commands.fetch_profile_data.requests.get")
+    @patch("api.management.commands.fetch_profile_data.requests.Session.get")
     def test_command_errors_on_unsuccessful_response(self, mock_get: MagicMock) -> None:
-        mock_get.return_value = MagicMock(status_code=500, text="error")
+        mock_get.return_value = _FakeResponse(None, status=500, text="error")
 
         with self.assertRaises(CommandError):
-            call_command("fetch_profile_data", screener_name=self.screener_name)
+            _call_command_silently("fetch_profile_data", screener_name=self.screener_name)
 
-    @patch("api.management.commands.fetch_profile_data.requests.get")
+    @patch("api.management.commands.fetch_profile_data.requests.Session.get")
     def test_command_can_skip_investments_with_price(self, mock_get: MagicMock) -> None:
         Investment.objects.filter(ticker="AAA").update(price=Decimal("5.00"))
-        mock_get.return_value = MagicMock(
-            status_code=200,
-            json=lambda: [
-                {"ticker": "AAA", "weekly_options": True},
-                {"ticker": "BBB", "weekly_options": True},
-            ],
-            text="{}",
-        )
+        mock_get.return_value = _FakeResponse(_AAA_BBB_PROFILE)
 
         with patch(
             "api.management.commands.fetch_profile_data.Command._fetch_option_expirations",
             return_value={"dates": [], "ticker_id": "BBB"},
         ) as mock_expirations:
             buffer = StringIO()
-            call_command(
+            _call_command_silently(
                 "fetch_profile_data",
                 "--skip-priced",
                 screener_name=self.screener_name,
@@ -1329,7 +1342,7 @@ class FetchProfileDataCommandTests(APITestCase):
         self.assertNotIn("AAA", output)
         self.assertIn("BBB", output)
 
-    @patch("api.management.commands.fetch_profile_data.requests.get")
+    @patch("api.management.commands.fetch_profile_data.requests.Session.get")
     def test_command_can_skip_investments_with_price_no_remaining(
         self, mock_get: MagicMock
     ) -> None:
@@ -1337,36 +1350,24 @@ class FetchProfileDataCommandTests(APITestCase):
         Investment.objects.filter(ticker="BBB").update(price=Decimal("7.00"))
         Investment.objects.filter(ticker="CCC").update(price=Decimal("9.00"))
 
-        mock_get.return_value = MagicMock(
-            status_code=200,
-            json=lambda: [
-                {"ticker": "AAA", "weekly_options": True},
-                {"ticker": "BBB", "weekly_options": True},
-                {"ticker": "CCC", "weekly_options": True},
-            ],
-            text="{}",
-        )
+        mock_get.return_value = _FakeResponse(_AAA_BBB_CCC_PROFILE)
 
         with self.assertRaisesMessage(
             CommandError, "No tickers remain to update after skipping priced investments."
         ):
-            call_command(
+            _call_command_silently(
                 "fetch_profile_data", "--skip-priced", screener_name=self.screener_name
             )
 
     @patch("api.management.commands.fetch_profile_data.Command._fetch_option_expirations")
-    @patch("api.management.commands.fetch_profile_data.requests.get")
+    @patch("api.management.commands.fetch_profile_data.requests.Session.get")
     def test_command_fetches_only_requested_screener(
         self, mock_get: MagicMock, mock_expirations: MagicMock
     ) -> None:
-        mock_get.return_value = MagicMock(
-            status_code=200,
-            json=lambda: [{"ticker": "AAA", "weekly_options": True}],
-            text="{}",
-        )
+        mock_get.return_value = _AAA_RESPONSE
         mock_expirations.return_value = {"dates": [], "ticker_id": "AAA"}
 
-        call_command("fetch_profile_data", screener_name=self.screener_name)
+        _call_command_silently("fetch_profile_data", screener_name=self.screener_name)
 
         mock_get.assert_called_once()
         self.assertEqual(
@@ -1374,44 +1375,34 @@ class FetchProfileDataCommandTests(APITestCase):
             {"screener_type": self.screener_name},
         )
 
-    @patch("api.management.commands.fetch_profile_data.requests.get")
+    @patch("api.management.commands.fetch_profile_data.requests.Session.get")
     def test_fetch_option_expirations_uses_expected_headers_and_params(
         self, mock_get: MagicMock
     ) -> None:
-        mock_get.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {"data": {"attributes": {"dates": [], "ticker_id": 1}}},
-            text="{}",
-        )
+        mock_get.return_value = _FakeResponse(_EMPTY_OPTION_EXPIRATIONS_PAYLOAD)
 
-        command = Command()
+        command = Command(stdout=StringIO(), stderr=StringIO())
         command._fetch_option_expirations("XYZ")
 
-        mock_get.assert_called_once()
-        request = mock_get.call_args
-        self.assertEqual(request.args[0], OPTION_EXPIRATIONS_ENDPOINT)
-        self.assertEqual(request.kwargs.get("params"), {"symbol": "XYZ"})
-        self.assertEqual(request.kwargs.get("headers"), API_HEADERS)
+        mock_get.assert_called_once_with(
+            OPTION_EXPIRATIONS_ENDPOINT,
+            params={"symbol": "XYZ"},
+            headers=API_HEADERS,
+            timeout=30,
+        )
 
     @patch("api.management.commands.fetch_profile_data.Command._fetch_option_expirations")
-    @patch("api.management.commands.fetch_profile_data.requests.get")
+    @patch("api.management.commands.fetch_profile_data.requests.Session.get")
     def test_command_skips_option_fetch_for_non_weekly(
         self, mock_get: MagicMock, mock_expirations: MagicMock
     ) -> None:
-        mock_get.return_value = MagicMock(
-            status_code=200,
-            json=lambda: [
-                {"ticker": "AAA", "weekly_options": True},
-                {"ticker": "BBB", "weekly_options": False},
-            ],
-            text="{}",
-        )
+        mock_get.return_value = _FakeResponse(_AAA_WEEKLY_BBB_DAILY_PROFILE)
         mock_expirations.return_value = {
             "dates": self._build_next_month_dates([5, 12, 19]),
             "ticker_id": "AAA",
         }
 
-        call_command("fetch_profile_data", screener_name=self.screener_name)
+        _call_command_silently("fetch_profile_data", screener_name=self.screener_name)
 
         mock_expirations.assert_called_once_with("AAA")
         investment = Investment.objects.get(ticker="BBB")
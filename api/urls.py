@@ -1,4 +1,3 @@
-from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
 from .views import (
@@ -16,4 +15,6 @@ router.register("screener-filters", ScreenerFilterViewSet)
 router.register("financial-statements", FinancialStatementViewSet)
 router.register("due-diligence-reports", DueDiligenceReportViewSet)
 
-urlpatterns = [path("", include(router.urls))]
+# Expose the router patterns directly rather than behind an extra empty-prefix
+# include(), so resolving a request walks one resolver level fewer.
+urlpatterns = list(router.urls)
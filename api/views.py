@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from decimal import Decimal, InvalidOperation
-from typing import Mapping
+from functools import cached_property
+from typing import Any, Mapping
 
 from django.db.models import Q, Value
 from django.db.models.functions import Replace
@@ -25,196 +26,257 @@ from .serializers import (
 )
 
 
+# Columns InvestmentSerializer renders; wide text columns such as description stay deferred.
+INVESTMENT_SERIALIZED_FIELDS = tuple(InvestmentSerializer.Meta.fields)
+# Read-only actions that render those columns and never save the instance back.
+INVESTMENT_READ_ACTIONS = frozenset({"list", "retrieve"})
+
+# Rows fetched per round trip when the custom screener branch renders every match.
+CUSTOM_SCREENER_CHUNK_SIZE = 500
+
+# (field, exact param, min param, max param) for each decimal filter, in validation order.
+_DECIMAL_FILTERS: tuple[tuple[str, str | None, str | None, str | None], ...] = (
+    ("price", "price", "min_price", "max_price"),
+    ("roi", "roi", "min_roi", "max_roi"),
+    ("delta", "delta", "min_delta", "max_delta"),
+    ("market_cap", None, "min_market_cap", "max_market_cap"),
+    ("rsi", None, "min_rsi", "max_rsi"),
+)
+# (exact, min, max) ORM lookups per decimal field, built once at import.
+_DECIMAL_LOOKUPS: dict[str, tuple[str, str, str]] = {
+    field_name: (field_name, f"{field_name}__gte", f"{field_name}__lte")
+    for field_name, *_params in _DECIMAL_FILTERS
+}
+
+# (query param, ORM lookup) pairs for the integer and boolean filters.
+_INTEGER_FILTERS: tuple[tuple[str, str], ...] = (
+    ("min_volume", "volume__gte"),
+    ("options_suitability", "options_suitability"),
+)
+_BOOLEAN_FILTERS: tuple[tuple[str, str], ...] = (("weekly_options", "weekly_options"),)
+
+# Accepted spellings for boolean query parameters.
+_BOOLEAN_VALUES: dict[str, bool] = {
+    **dict.fromkeys(("true", "1", "yes", "y"), True),
+    **dict.fromkeys(("false", "0", "no", "n"), False),
+}
+
+# (query param, ORM lookup) pairs for plain text filters, applied when the param is non-empty.
+_INVESTMENT_TEXT_FILTERS: tuple[tuple[str, str], ...] = (
+    ("category", "category__iexact"),
+    ("ticker", "ticker__icontains"),
+)
+
+# Every query parameter InvestmentViewSet.get_queryset knows how to filter on, derived
+# from the filter tables so a new table entry is never skipped by the early return.
+INVESTMENT_FILTER_PARAMS = frozenset(
+    {
+        "screener_type",
+        *(
+            param_name
+            for _field_name, *param_names in _DECIMAL_FILTERS
+            for param_name in param_names
+            if param_name is not None
+        ),
+        *(
+            param_name
+            for filters in (_INTEGER_FILTERS, _BOOLEAN_FILTERS, _INVESTMENT_TEXT_FILTERS)
+            for param_name, _lookup in filters
+        ),
+    }
+)
+
+_FINANCIAL_STATEMENT_FILTERS: tuple[tuple[str, str], ...] = (
+    ("symbol", "symbol__iexact"),
+    ("target_currency", "target_currency__iexact"),
+    ("period_type", "period_type__iexact"),
+    ("statement_type", "statement_type__iexact"),
+)
+_DUE_DILIGENCE_FILTERS: tuple[tuple[str, str], ...] = (
+    ("symbol", "symbol__iexact"),
+    ("rating", "rating__iexact"),
+    ("model_name", "model_name__iexact"),
+)
+
+
+def _text_lookups(
+    params: Mapping[str, str], filters: tuple[tuple[str, str], ...]
+) -> dict[str, str]:
+    lookups: dict[str, str] = {}
+    for param_name, lookup in filters:
+        value = params.get(param_name)
+        if value:
+            lookups[lookup] = value
+    return lookups
+
+
+def _parse_decimal(raw_value: str | None, field: str) -> Decimal | None:
+    if raw_value is None:
+        return None
+    try:
+        value = Decimal(raw_value)
+    except (InvalidOperation, TypeError):
+        raise ValidationError({field: "Enter a valid number."})
+    return value
+
+
+def _parse_integer(raw_value: str | None, field: str) -> int | None:
+    if raw_value is None:
+        return None
+
+    try:
+        return int(raw_value)
+    except (TypeError, ValueError):
+        raise ValidationError({field: "Enter a valid integer."})
+
+
+def _parse_boolean(raw_value: str | None, field: str) -> bool | None:
+    if raw_value is None:
+        return None
+
+    value = _BOOLEAN_VALUES.get(raw_value.strip().lower())
+    if value is None:
+        raise ValidationError({field: "Enter a valid boolean."})
+    return value
+
+
 class InvestmentViewSet(viewsets.ModelViewSet):
     """CRUD viewset that also supports lightweight filtering."""
 
     queryset = Investment.objects.all()
     serializer_class = InvestmentSerializer
+    # Legacy query parameter names, rewritten to their current name in _query_params.
+    _PARAM_ALIASES = {"screenter_type": "screener_type"}
 
     def list(self, request, *args, **kwargs):  # type: ignore[override]
-        screener_type = request.query_params.get("screener_type") or request.query_params.get(
-            "screenter_type"
-        )
-        if screener_type and screener_type.strip().lower() == "custom screener filter":
+        if self._screener_type.lower() == "custom screener filter":
             queryset = self.filter_queryset(self.get_queryset())
-            serializer = self.get_serializer(queryset, many=True)
-            return Response({"count": len(serializer.data), "results": serializer.data})
+            page = self.paginate_queryset(queryset)
+            if page is not None:
+                serializer = self.get_serializer(page, many=True)
+                return self.get_paginated_response(serializer.data)
+
+            # Without a paginator every row is serialized anyway, so counting the
+            # serialized rows avoids a separate COUNT query. Iterating in chunks keeps
+            # model instances out of the queryset's result cache while they are rendered.
+            results = self.get_serializer(
+                queryset.iterator(chunk_size=CUSTOM_SCREENER_CHUNK_SIZE), many=True
+            ).data
+            return Response({"count": len(results), "results": results})
 
         return super().list(request, *args, **kwargs)
 
     def get_queryset(self):  # type: ignore[override]
-        queryset = super().get_queryset()
-        params = self.request.query_params
+        params = self._query_params
+        # Most list requests are unfiltered; skip all parsing when no filter is present.
+        has_filters = bool(params) and not params.keys().isdisjoint(INVESTMENT_FILTER_PARAMS)
+        # Parse (and reject) every typed filter before any queryset is built, so an
+        # invalid request returns 400 without paying for ORM clones.
+        typed_lookups = self._parsed_filter_lookups if has_filters else {}
 
-        category = params.get("category")
-        if category:
-            queryset = queryset.filter(category__iexact=category)
+        queryset = super().get_queryset()
+        if self.action in INVESTMENT_READ_ACTIONS:
+            queryset = queryset.only(*INVESTMENT_SERIALIZED_FIELDS)
+        if not has_filters:
+            return queryset
+        # Collect every lookup first so the queryset is cloned by a single filter() call.
+        conditions: list[Q] = []
+        lookups: dict[str, Any] = _text_lookups(params, _INVESTMENT_TEXT_FILTERS)
+        lookups.update(typed_lookups)
 
-        screener_type = params.get("screener_type") or params.get("screenter_type")
-        if screener_type:
-            normalized_screener_type = " ".join(screener_type.split())
+        normalized_screener_type = self._screener_type
+        if normalized_screener_type:
             compact_screener_type = normalized_screener_type.replace(" ", "")
             queryset = queryset.annotate(
                 screener_type_compact=Replace("screener_type", Value(" "), Value(""))
-            ).filter(
+            )
+            conditions.append(
                 Q(screener_type__iexact=normalized_screener_type)
                 | Q(screener_type_compact__iexact=compact_screener_type)
             )
 
-        ticker_query = params.get("ticker")
-        if ticker_query:
-            queryset = queryset.filter(ticker__icontains=ticker_query)
-
-        queryset = self._apply_decimal_filter(
-            queryset,
-            params,
-            field_name="price",
-            exact_param="price",
-            min_param="min_price",
-            max_param="max_price",
-        )
-        queryset = self._apply_decimal_filter(
-            queryset,
-            params,
-            field_name="roi",
-            exact_param="roi",
-            min_param="min_roi",
-            max_param="max_roi",
-        )
-        queryset = self._apply_decimal_filter(
-            queryset,
-            params,
-            field_name="delta",
-            exact_param="delta",
-            min_param="min_delta",
-            max_param="max_delta",
-        )
-        queryset = self._apply_decimal_filter(
-            queryset,
-            params,
-            field_name="market_cap",
-            min_param="min_market_cap",
-            max_param="max_market_cap",
-        )
-        queryset = self._apply_decimal_filter(
-            queryset,
-            params,
-            field_name="rsi",
-            min_param="min_rsi",
-            max_param="max_rsi",
-        )
-        queryset = self._apply_integer_min_filter(
-            queryset, params, field_name="volume", param_name="min_volume"
-        )
-        queryset = self._apply_integer_exact_filter(
-            queryset,
-            params,
-            field_name="options_suitability",
-            param_name="options_suitability",
-        )
-        queryset = self._apply_boolean_filter(
-            queryset,
-            params,
-            field_name="weekly_options",
-            param_name="weekly_options",
-        )
-
-        return queryset
+        if not conditions and not lookups:
+            return queryset
+        return queryset.filter(*conditions, **lookups)
 
     def perform_create(self, serializer: InvestmentSerializer) -> None:
         serializer.save()
 
-    def _apply_decimal_filter(
-        self,
-        queryset,
-        params: Mapping[str, str],
-        *,
-        field_name: str,
-        exact_param: str | None = None,
-        min_param: str | None = None,
-        max_param: str | None = None,
-    ):
-        exact_value = (
-            self._parse_decimal(params.get(exact_param), exact_param) if exact_param else None
-        )
-        min_value = self._parse_decimal(params.get(min_param), min_param) if min_param else None
-        max_value = self._parse_decimal(params.get(max_param), max_param) if max_param else None
-
-        if min_value is not None and max_value is not None and min_value > max_value:
-            raise ValidationError(
-                {max_param: "Maximum value must be greater than or equal to minimum value."}
-            )
-
-        if exact_value is not None:
-            queryset = queryset.filter(**{field_name: exact_value})
-        if min_value is not None:
-            queryset = queryset.filter(**{f"{field_name}__gte": min_value})
-        if max_value is not None:
-            queryset = queryset.filter(**{f"{field_name}__lte": max_value})
-        return queryset
-
-    def _apply_integer_min_filter(
-        self, queryset, params: Mapping[str, str], *, field_name: str, param_name: str
-    ):
-        value = self._parse_integer(params.get(param_name), param_name)
-        if value is None:
-            return queryset
-
-        return queryset.filter(**{f"{field_name}__gte": value})
-
-    def _apply_integer_exact_filter(
-        self, queryset, params: Mapping[str, str], *, field_name: str, param_name: str
-    ):
-        value = self._parse_integer(params.get(param_name), param_name)
-        if value is None:
-            return queryset
-
-        return queryset.filter(**{field_name: value})
-
-    def _apply_boolean_filter(
-        self, queryset, params: Mapping[str, str], *, field_name: str, param_name: str
-    ):
-        value = self._parse_boolean(params.get(param_name), param_name)
-        if value is None:
-            return queryset
-
-        return queryset.filter(**{field_name: value})
-
-    def _parse_decimal(self, raw_value: str | None, field: str) -> Decimal | None:
-        if raw_value is None:
-            return None
-        try:
-            value = Decimal(raw_value)
-        except (InvalidOperation, TypeError):
-            raise ValidationError({field: "Enter a valid number."})
-        return value
-
-    def _parse_integer(self, raw_value: str | None, field: str) -> int | None:
-        if raw_value is None:
-            return None
-
-        try:
-            return int(raw_value)
-        except (TypeError, ValueError):
-            raise ValidationError({field: "Enter a valid integer."})
-
-    def _parse_boolean(self, raw_value: str | None, field: str) -> bool | None:
-        if raw_value is None:
-            return None
-
-        normalized_value = raw_value.strip().lower()
-        if normalized_value in {"true", "1", "yes", "y"}:
-            return True
-        if normalized_value in {"false", "0", "no", "n"}:
-            return False
-
-        raise ValidationError({field: "Enter a valid boolean."})
+    @cached_property
+    def _query_params(self) -> dict[str, str]:
+        # Plain-dict snapshot (last value per key, as QueryDict.get returns); every
+        # later read is a dict lookup instead of QueryDict's value-list indexing.
+        params = self.request.query_params.dict()
+        # Fold legacy aliases in here so the rest of the view only sees current names.
+        for alias, name in self._PARAM_ALIASES.items():
+            alias_value = params.pop(alias, None)
+            if alias_value and not params.get(name):
+                params[name] = alias_value
+        return params
+
+    @cached_property
+    def _screener_type(self) -> str:
+        # list() and get_queryset() both branch on the screener type; normalize it once.
+        return " ".join(self._query_params.get("screener_type", "").split())
+
+    @cached_property
+    def _parsed_filter_lookups(self) -> dict[str, Any]:
+        # DRF builds a fresh view per request, so the typed filters are parsed once and
+        # every invalid parameter is reported in the same 400 response.
+        params = self._query_params
+        lookups: dict[str, Any] = {}
+        errors: dict[str, Any] = {}
+
+        def parse(parser, param_name: str | None) -> Any:
+            if param_name is None:
+                return None
+            try:
+                return parser(params.get(param_name), param_name)
+            except ValidationError as exc:
+                errors.update(exc.detail)
+                return None
+
+        for field_name, exact_param, min_param, max_param in _DECIMAL_FILTERS:
+            exact_value = parse(_parse_decimal, exact_param)
+            min_value = parse(_parse_decimal, min_param)
+            max_value = parse(_parse_decimal, max_param)
+
+            if min_value is not None and max_value is not None and min_value > max_value:
+                errors[max_param] = "Maximum value must be greater than or equal to minimum value."
+
+            exact_lookup, min_lookup, max_lookup = _DECIMAL_LOOKUPS[field_name]
+            if exact_value is not None:
+                lookups[exact_lookup] = exact_value
+            if min_value is not None:
+                lookups[min_lookup] = min_value
+            if max_value is not None:
+                lookups[max_lookup] = max_value
+
+        for param_name, lookup in _INTEGER_FILTERS:
+            value = parse(_parse_integer, param_name)
+            if value is not None:
+                lookups[lookup] = value
+        for param_name, lookup in _BOOLEAN_FILTERS:
+            value = parse(_parse_boolean, param_name)
+            if value is not None:
+                lookups[lookup] = value
+
+        if errors:
+            raise ValidationError(errors)
+        return lookups
 
 
 class ScreenerTypeViewSet(viewsets.ModelViewSet):
     queryset = ScreenerType.objects.prefetch_related("filters").all()
     serializer_class = ScreenerTypeSerializer
 
+    def get_queryset(self):  # type: ignore[override]
+        queryset = super().get_queryset()
+        # Deleting never renders the nested filters, so skip their prefetch query.
+        if self.action == "destroy":
+            return queryset.prefetch_related(None)
+        return queryset
+
 
 class ScreenerFilterViewSet(viewsets.ModelViewSet):
     queryset = ScreenerFilter.objects.select_related("screener_type").all()
@@ -227,25 +289,8 @@ class FinancialStatementViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):  # type: ignore[override]
         queryset = super().get_queryset()
-        params = self.request.query_params
-
-        symbol = params.get("symbol")
-        if symbol:
-            queryset = queryset.filter(symbol__iexact=symbol)
-
-        target_currency = params.get("target_currency")
-        if target_currency:
-            queryset = queryset.filter(target_currency__iexact=target_currency)
-
-        period_type = params.get("period_type")
-        if period_type:
-            queryset = queryset.filter(period_type__iexact=period_type)
-
-        statement_type = params.get("statement_type")
-        if statement_type:
-            queryset = queryset.filter(statement_type__iexact=statement_type)
-
-        return queryset
+        lookups = _text_lookups(self.request.query_params, _FINANCIAL_STATEMENT_FILTERS)
+        return queryset.filter(**lookups) if lookups else queryset
 
 
 class DueDiligenceReportViewSet(viewsets.ModelViewSet):
@@ -254,18 +299,5 @@ class DueDiligenceReportViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):  # type: ignore[override]
         queryset = super().get_queryset()
-        params = self.request.query_params
-
-        symbol = params.get("symbol")
-        if symbol:
-            queryset = queryset.filter(symbol__iexact=symbol)
-
-        rating = params.get("rating")
-        if rating:
-            queryset = queryset.filter(rating__iexact=rating)
-
-        model_name = params.get("model_name")
-        if model_name:
-            queryset = queryset.filter(model_name__iexact=model_name)
-
-        return queryset
+        lookups = _text_lookups(self.request.query_params, _DUE_DILIGENCE_FILTERS)
+        return queryset.filter(**lookups) if lookups else queryset
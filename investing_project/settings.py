@@ -76,6 +76,7 @@ REST_FRAMEWORK = {
         "rest_framework.parsers.JSONParser",
         "rest_framework.parsers.FormParser",
     ],
+    "TEST_REQUEST_DEFAULT_FORMAT": "json",
 }
 
 MIDDLEWARE = [
@@ -0,0 +1,33 @@
+"""
+Django settings for running the investing_project test suite.
+
+Always uses an in-memory SQLite database, regardless of any POSTGRES_* variables
+in the environment, builds the schema straight from the models and hashes
+passwords with MD5.
+"""
+
+from .settings import *  # noqa: F401,F403
+
+
+class DisableMigrations:
+    """Report every app as having no migrations so tables are built from models."""
+
+    def __contains__(self, item: str) -> bool:
+        return True
+
+    def __getitem__(self, item: str) -> None:
+        return None
+
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+    }
+}
+
+# PBKDF2 is deliberately slow; tests do not need production-strength hashing.
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+# Replaying the full migration history dominates test database setup.
+MIGRATION_MODULES = DisableMigrations()
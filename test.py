@@ -1,7 +1,36 @@
+import io
+from pathlib import Path
+
 import pandas as pd
+import requests
 
 url = "https://www.cboe.com/available_weeklys/get_csv_download/"
-df = pd.read_csv(url)
+cache_path = Path.home() / ".cache" / "cboe_weeklys.csv"
+etag_path = cache_path.with_suffix(".etag")
+
+
+def load_weeklys_csv() -> str:
+    """Return the weeklys CSV, re-downloading it only when CBOE reports a change."""
+    headers = {}
+    if cache_path.exists() and etag_path.exists():
+        headers["If-None-Match"] = etag_path.read_text().strip()
+
+    response = requests.get(url, headers=headers, timeout=30)
+    if response.status_code == 304:
+        return cache_path.read_text()
+    response.raise_for_status()
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(response.text)
+    etag = response.headers.get("ETag")
+    if etag:
+        etag_path.write_text(etag)
+    else:
+        etag_path.unlink(missing_ok=True)
+    return response.text
+
+
+df = pd.read_csv(io.StringIO(load_weeklys_csv()), dtype=str)
 
 # Show columns / first rows (format can change over time)
 print(df.columns)
@@ -9,5 +38,8 @@ print(df.head())
 
 # Example: check if ticker appears anywhere in the CSV
 ticker = "AAPL"
-has_weeklys = df.astype(str).apply(lambda col: col.str.fullmatch(ticker, case=False, na=False)).any().any()
+# Cells are already strings (dtype=str), so compare upper-cased columns directly
+# instead of copying the frame with astype(str) and regex-matching every cell.
+ticker_upper = ticker.upper()
+has_weeklys = bool(df.apply(lambda col: col.str.upper().eq(ticker_upper)).to_numpy().any())
 print(ticker, "has weeklies?" , has_weeklys)
\ No newline at end of file